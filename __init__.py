@@ -3,8 +3,25 @@
 
 from __future__ import annotations
 
-from .addon import bl_info  # noqa: F401
-from .addon import register as register  # re-export
-from .addon import unregister as unregister  # re-export
-
 __all__ = ("bl_info", "register", "unregister")
+
+
+bl_info = {
+    "name": "Monkey hunyuan3D",
+    "author": "Sakaki Masamune",
+    "version": (0, 1, 0),
+    "blender": (4, 0, 0),
+    "location": "3D View > Sidebar > Monkey hunyuan3D",
+    "description": (
+        "Connects Blender to Tencent Cloud Hunyuan3D 3.0 API to generate and import assets."
+    ),
+    "category": "3D View",
+}
+
+
+def __getattr__(name: str):
+    if name in ("register", "unregister"):
+        from . import addon
+
+        return getattr(addon, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""Scene property groups, loaded on first access to keep add-on scans cheap."""
+
+from __future__ import annotations
+
+import bpy
+from bpy.app.translations import pgettext_iface as _
+from bpy.props import (
+    BoolProperty,
+    EnumProperty,
+    IntProperty,
+    StringProperty,
+)
+
+from . import DEFAULT_MAX_EDGE_PX, DEFAULT_REGION
+
+_REGION_GZ = _("Use the ap-guangzhou region.")
+_REGION_SH = _("Use the ap-shanghai region.")
+_REGION_SG = _("Use the ap-singapore region.")
+
+_INPUT_MODE_ITEMS = (
+    ("PROMPT", "Prompt", _("Use text prompt only")),
+    ("IMAGE", "Image", _("Use local image file (Base64)")),
+)
+_PROMPT_SOURCE_ITEMS = (
+    ("INLINE", "Inline", _("Use inline textbox.")),
+    ("TEXT_BLOCK", "Text Block", _("Use a Blender Text datablock.")),
+    ("EXTERNAL_FILE", "External File", _("Load from a file on disk.")),
+)
+_RESULT_FORMAT_ITEMS = (
+    ("GLB", "GLB", _("Download model as glTF Binary (.glb).")),
+    ("OBJ", "OBJ", _("Download model as Wavefront OBJ.")),
+    ("FBX", "FBX", _("Download model as Autodesk FBX.")),
+)
+_REGION_ITEMS = (
+    ("ap-guangzhou", "ap-guangzhou", _REGION_GZ),
+    ("ap-shanghai", "ap-shanghai", _REGION_SH),
+    ("ap-singapore", "ap-singapore", _REGION_SG),
+)
+
+
+class MH3DSettings(bpy.types.PropertyGroup):
+    """Shared settings stored on the scene."""
+
+    input_mode: EnumProperty(
+        name=_("Input Mode"),
+        description=_("Choose how to provide input to Hunyuan3D."),
+        items=_INPUT_MODE_ITEMS,
+        default="IMAGE",
+    )
+    prompt_source: EnumProperty(
+        name=_("Prompt Source"),
+        description=_("Where to read the prompt text in PROMPT mode."),
+        items=_PROMPT_SOURCE_ITEMS,
+        default="INLINE",
+    )
+    prompt: StringProperty(
+        name=_("Prompt"),
+        description=_("Prompt used for Hunyuan3D generation."),
+        default="a cute robot toy",
+    )
+    prompt_text_name: StringProperty(
+        name=_("Text Block"),
+        description=_("Name of the Blender Text datablock used as prompt source."),
+        default="",
+    )
+    prompt_file_path: StringProperty(
+        name=_("Prompt File"),
+        description=_("External file path for prompt source."),
+        subtype='FILE_PATH',
+        default="",
+        options={"SKIP_SAVE"},
+    )
+    image_path: StringProperty(
+        name=_("Image"),
+        description=_("Local image file used as reference for generation."),
+        subtype='FILE_PATH',
+        default="",
+        options={"SKIP_SAVE"},
+    )
+    max_edge_px: IntProperty(
+        name=_("Max Image Edge"),
+        description=_("Longest edge in pixels for images that are recompressed before upload."),
+        subtype='PIXEL',
+        default=DEFAULT_MAX_EDGE_PX,
+        min=256,
+        soft_max=8192,
+    )
+    result_format: EnumProperty(
+        name=_("Result Format"),
+        description=_("File format of the generated asset."),
+        items=_RESULT_FORMAT_ITEMS,
+        default="GLB",
+    )
+    enable_pbr: BoolProperty(
+        name=_("Enable PBR"),
+        description=_("Request physically based rendering materials when supported."),
+        default=False,
+    )
+    region: EnumProperty(
+        name=_("Region"),
+        description=_("Tencent Cloud region used for the Hunyuan3D service."),
+        items=_REGION_ITEMS,
+        default=DEFAULT_REGION,
+    )
+    secret_id: StringProperty(
+        name=_("SecretId"),
+        description=_("Fallback SecretId when environment variables are unavailable."),
+        default="",
+        options={"SKIP_SAVE"},
+    )
+    secret_key: StringProperty(
+        name=_("SecretKey"),
+        description=_("Fallback SecretKey when environment variables are unavailable."),
+        default="",
+        subtype='PASSWORD',
+        options={"SKIP_SAVE"},
+    )
+    job_id: StringProperty(
+        name=_("JobId"),
+        description=_("Last submitted job identifier."),
+        default="",
+        options={"SKIP_SAVE"},
+    )
+    last_status: StringProperty(
+        name=_("Status"),
+        description=_("Last known status reported by the API."),
+        default="",
+        options={"SKIP_SAVE"},
+    )
+    last_error: StringProperty(
+        name=_("Last Error"),
+        description=_("Last error message reported by the API or importer."),
+        default="",
+        options={"SKIP_SAVE"},
+    )
+
+
+_CLASSES: tuple[type[bpy.types.PropertyGroup], ...] = (MH3DSettings,)
@@ -11,20 +11,28 @@ from .utils_deps import ensure_package
 
 logger = get_logger()
 
+_REQUIREMENTS = (
+    ("PIL", "Pillow"),
+    ("tencentcloud", "tencentcloud-sdk-python"),
+)
+_INSTALLED: set[str] = set()
+
 
 class MH3D_OT_InstallDeps(bpy.types.Operator):
     """Install required third-party dependencies into the add-on vendor directory."""
 
     bl_idname = "mh3d.install_deps"
-    bl_label = _("Install Dependencies")
-    bl_description = _(
-        "Install Pillow and Tencent Cloud SDK into the add-on vendor folder."
-    )
+    bl_label = "Install Dependencies"
+    bl_description = "Install Pillow and Tencent Cloud SDK into the add-on vendor folder."
 
     def execute(self, context: bpy.types.Context) -> set[str]:
         try:
-            ensure_package("PIL", "Pillow")
-            ensure_package("tencentcloud", "tencentcloud-sdk-python")
+            for mod_name, pip_name in _REQUIREMENTS:
+                if mod_name in _INSTALLED:
+                    continue
+                # Imports the module first; a broken install falls through to pip.
+                ensure_package(mod_name, pip_name)
+                _INSTALLED.add(mod_name)
         except Exception as exc:  # pragma: no cover - depends on user environment
             message = _("Failed to install dependencies: {error}").format(error=exc)
             self.report({'ERROR'}, message)
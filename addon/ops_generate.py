@@ -3,31 +3,69 @@
 
 from __future__ import annotations
 
-import base64
+import functools
 import io
 import json
+import logging
+import math
+import mmap
 import os
-import shutil
+import queue
+import random
+import re
 import tempfile
+import threading
+import time
 import urllib.error
 import urllib.request
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, Optional
 
 import bpy
 from bpy.app.translations import pgettext_iface as _
-from bpy.types import Operator, Window
+from bpy.types import Operator, WindowManager
 
-from . import ADDON_ID, DEFAULT_REGION, get_logger
+from . import ADDON_ID, DEFAULT_MAX_EDGE_PX, DEFAULT_REGION, get_logger
 from .utils_deps import ensure_package
 
+try:  # Optional SIMD-accelerated drop-in for the stdlib codec.
+    import pybase64 as _b64  # type: ignore[import-not-found]
+except ImportError:
+    import base64 as _b64
+
+try:  # Optional C parser for the SDK's JSON responses, parsed every poll tick.
+    from orjson import loads as _json_loads  # type: ignore[import-not-found]
+except ImportError:
+    from json import loads as _json_loads
+
 logger = get_logger()
 
 API_ENDPOINT = "ai3d.tencentcloudapi.com"
 API_VERSION = "2025-05-13"
+# Status queries back off from POLL_INTERVAL by POLL_BACKOFF per poll, up to
+# POLL_MAX_INTERVAL, with +/-POLL_JITTER spread; a status change resets it.
 POLL_INTERVAL = 2.0
+POLL_BACKOFF = 1.5
+POLL_MAX_INTERVAL = 30.0
+POLL_JITTER = 0.25
+# Queued jobs cannot finish before they start running, so poll them less often.
+QUEUED_POLL_INTERVAL = 5.0
+# Give up on a job that has not reached a final status after this long.
+POLL_TIMEOUT = 30 * 60.0
+# How often the UI thread drains results from the background job thread.
+RESULT_CHECK_INTERVAL = 0.2
 MAX_IMAGE_BASE64_SIZE = 8 * 1024 * 1024
 JPEG_QUALITY_STEPS = (95, 90, 85, 80, 75, 70, 65, 60)
+# Keep downscaling while even the lowest JPEG quality is over the size limit,
+# down to this longest edge.
+MIN_DOWNSCALE_EDGE_PX = 512
+# Multiple of 3 so per-chunk Base64 output concatenates without padding.
+BASE64_CHUNK_SIZE = 57 * 1024
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# Each cached payload can approach MAX_IMAGE_BASE64_SIZE, so keep the cache small.
+ENCODE_CACHE_SIZE = 4
+PROMPT_CACHE_SIZE = 8
 
 
 @dataclass(frozen=True)
@@ -39,7 +77,14 @@ class _SDKBundle:
     exception_cls: Any
 
 
+@functools.lru_cache(maxsize=1)
 def _import_sdk() -> _SDKBundle:
+    try:
+        ensure_package("tencentcloud", "tencentcloud-sdk-python")
+    except Exception as exc:  # pragma: no cover - subprocess outcome
+        raise RuntimeError(
+            _("Failed to install Tencent Cloud SDK: {error}").format(error=exc)
+        ) from exc
     try:
         from tencentcloud.common import credential
         from tencentcloud.common.abstract_client import AbstractClient
@@ -48,27 +93,10 @@ def _import_sdk() -> _SDKBundle:
         )
         from tencentcloud.common.profile.client_profile import ClientProfile
         from tencentcloud.common.profile.http_profile import HttpProfile
-    except ImportError:
-        try:
-            ensure_package("tencentcloud", "tencentcloud-sdk-python")
-        except Exception as exc:  # pragma: no cover - subprocess outcome
-            raise RuntimeError(
-                _("Failed to install Tencent Cloud SDK: {error}").format(error=exc)
-            ) from exc
-        try:
-            from tencentcloud.common import credential
-            from tencentcloud.common.abstract_client import AbstractClient
-            from tencentcloud.common.exception.tencent_cloud_sdk_exception import (
-                TencentCloudSDKException,
-            )
-            from tencentcloud.common.profile.client_profile import ClientProfile
-            from tencentcloud.common.profile.http_profile import HttpProfile
-        except ImportError as exc:  # pragma: no cover - environment dependent
-            raise RuntimeError(
-                _(
-                    "Failed to import Tencent Cloud SDK after installation attempt."
-                )
-            ) from exc
+    except ImportError as exc:  # pragma: no cover - environment dependent
+        raise RuntimeError(
+            _("Failed to import Tencent Cloud SDK after installation attempt.")
+        ) from exc
 
     class Hunyuan3DClient(AbstractClient):
         _apiVersion = API_VERSION
@@ -87,29 +115,133 @@ def _import_sdk() -> _SDKBundle:
     )
 
 
-def _create_client(
-    bundle: _SDKBundle, secret_id: str, secret_key: str, region: Optional[str] = None
-) -> Any:
+def _create_client(bundle: _SDKBundle, secret_id: str, secret_key: str, region: str) -> Any:
     http_profile = bundle.http_profile_cls(endpoint=API_ENDPOINT)
     try:
         setattr(http_profile, "reqTimeout", 15)
+        # The cached client serves every poll; keep its connection open.
+        setattr(http_profile, "keepAlive", True)
     except Exception:
         pass
     client_profile = bundle.client_profile_cls(httpProfile=http_profile)
     cred = bundle.credential_factory(secret_id, secret_key)
-    region_value = (region or DEFAULT_REGION).strip() or DEFAULT_REGION
-    return bundle.client_cls(cred, region_value, client_profile)
+    return bundle.client_cls(cred, region, client_profile)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_client(secret_id: str, secret_key: str, region: str) -> Any:
+    # One client per credential/region pair, reused by every job and poll tick.
+    return _create_client(_import_sdk(), secret_id, secret_key, region)
+
+
+# Message ids are translated at the call site: module constants are created
+# before i18n.register() runs, so translating them here would freeze English.
+_MSG_INVALID_IMAGE = "Image mode requires a valid image file."
+_PROMPT_ERROR_MSGIDS = frozenset(
+    {
+        "No text block selected.",
+        "File path is empty.",
+        "Failed to read prompt from file.",
+        "Prompt is empty.",
+    }
+)
+
+# SDK error code -> hint msgid, translated when the hint is shown.
+_HINT_TABLE = {
+    "RequestLimitExceeded.JobNumExceed": "Another job is running. Wait until it finishes.",
+    "UnsupportedRegion": (
+        "This API is unavailable in the selected region. Try ap-guangzhou / ap-shanghai / ap-singapore."
+    ),
+    "AuthFailure.SecretIdNotFound": (
+        "Verify that your SecretId/SecretKey are correct and not disabled or deleted."
+    ),
+}
+_HINT_RE = re.compile("|".join(re.escape(code) for code in _HINT_TABLE))
+
+_QUEUED_STATUSES = frozenset({"SUBMITTED", "WAIT", "QUEUED", "PENDING"})
+# Rough progress shown in the cursor while a job is tracked; the API reports
+# no percentage, so each phase maps to a fixed value out of 100.
+_PROGRESS_BY_PHASE = {
+    "ENCODED": 10,
+    "SUBMITTED": 20,
+    "QUEUED": 30,
+    "RUNNING": 60,
+    "IMPORTING": 90,
+}
+_SUCCESS_STATUSES = frozenset({"DONE", "SUCCEED", "SUCCEEDED", "SUCCESS"})
+_FAILURE_STATUSES = frozenset({"FAIL", "FAILED"})
+
+
+@functools.lru_cache(maxsize=1)
+def _download_pool() -> Any:
+    # urllib3 arrives with the Tencent SDK (via requests); without it, fall back
+    # to one-shot urllib connections.
+    try:
+        import urllib3  # type: ignore[import-not-found]
+    except ImportError:
+        return None
+    return urllib3.PoolManager(
+        num_pools=4,
+        maxsize=8,
+        retries=urllib3.Retry(total=3, backoff_factor=0.3),
+    )
+
+
+def _copy_response(response: Any, handle: Any) -> None:
+    try:
+        expected = int(response.headers.get("Content-Length") or 0)
+    except ValueError:
+        expected = 0
+    if expected > 0 and hasattr(os, "posix_fallocate"):
+        try:
+            # Reserve the whole result up front rather than extending per write.
+            os.posix_fallocate(handle.fileno(), 0, expected)
+        except OSError:
+            pass
+    # Read into one reusable buffer instead of allocating bytes per chunk.
+    buffer = bytearray(DOWNLOAD_CHUNK_SIZE)
+    with memoryview(buffer) as view:
+        while True:
+            count = response.readinto(view)
+            if not count:
+                break
+            handle.write(view[:count])
+    # Drop any preallocated tail if the body came up short.
+    handle.truncate()
+
+
+def _fetch_to_handle(url: str, handle: Any) -> None:
+    pool = _download_pool()
+    if pool is None:
+        with urllib.request.urlopen(url, timeout=30) as response:
+            _copy_response(response, handle)
+        return
+
+    import urllib3  # type: ignore[import-not-found]
+
+    # Surface failures as urllib errors so callers handle both paths alike.
+    try:
+        response = pool.request("GET", url, preload_content=False, timeout=30.0)
+    except urllib3.exceptions.HTTPError as exc:
+        raise urllib.error.URLError(exc) from exc
+    try:
+        if response.status >= 400:
+            raise urllib.error.HTTPError(
+                url, response.status, response.reason or "", response.headers, None
+            )
+        try:
+            _copy_response(response, handle)
+        except urllib3.exceptions.HTTPError as exc:
+            raise urllib.error.URLError(exc) from exc
+    finally:
+        response.release_conn()
 
 
 def _download_file(url: str, suffix: str) -> str:
-    tmp = tempfile.NamedTemporaryFile(prefix="mh3d_", suffix=suffix, delete=False)
-    tmp_path = tmp.name
-    tmp.close()
+    fd, tmp_path = tempfile.mkstemp(prefix="mh3d_", suffix=suffix)
     try:
-        with urllib.request.urlopen(url, timeout=30) as response, open(
-            tmp_path, "wb"
-        ) as handle:
-            shutil.copyfileobj(response, handle)
+        with os.fdopen(fd, "wb") as handle:
+            _fetch_to_handle(url, handle)
     except Exception:
         if os.path.exists(tmp_path):
             os.remove(tmp_path)
@@ -117,34 +249,126 @@ def _download_file(url: str, suffix: str) -> str:
     return tmp_path
 
 
-def _import_model(filepath: str, fmt: str) -> None:
-    fmt_upper = fmt.upper()
-    if fmt_upper == "GLB":
-        bpy.ops.import_scene.gltf(filepath=filepath)
-    elif fmt_upper == "OBJ":
+def _remove_temp_file(filepath: str) -> None:
+    if filepath and os.path.exists(filepath):
         try:
-            bpy.ops.wm.obj_import(filepath=filepath)
-        except AttributeError:
-            bpy.ops.import_scene.obj(filepath=filepath)
-    elif fmt_upper == "FBX":
-        bpy.ops.import_scene.fbx(filepath=filepath)
-    else:  # pragma: no cover - defensive guard
+            os.remove(filepath)
+        except Exception:  # pragma: no cover - best effort cleanup
+            logger.warning("Failed to remove temporary file %s", filepath)
+
+
+# Result format -> (download suffix, importer operator). bl_info requires
+# Blender 4.0, where the legacy import_scene.obj operator no longer exists.
+_FORMAT_TABLE: Dict[str, tuple[str, Callable[..., Any]]] = {
+    "GLB": (".glb", bpy.ops.import_scene.gltf),
+    "OBJ": (".obj", bpy.ops.wm.obj_import),
+    "FBX": (".fbx", bpy.ops.import_scene.fbx),
+}
+
+
+def _import_model(filepath: str, fmt: str) -> None:
+    entry = _FORMAT_TABLE.get(fmt.upper())
+    if entry is None:  # pragma: no cover - defensive guard
         raise ValueError(f"Unsupported format: {fmt}")
+    entry[1](filepath=filepath)
 
 
 def _suffix_for_format(fmt: str) -> str:
-    return {
-        "GLB": ".glb",
-        "OBJ": ".obj",
-        "FBX": ".fbx",
-    }.get(fmt.upper(), ".bin")
+    entry = _FORMAT_TABLE.get(fmt.upper())
+    return entry[0] if entry is not None else ".bin"
+
+
+def _is_passthrough_format(path: str) -> bool:
+    # Sniff the header rather than trusting the extension.
+    with open(path, "rb") as handle:
+        header = handle.read(12)
+    return (
+        header.startswith(b"\xff\xd8\xff")
+        or header.startswith(b"\x89PNG\r\n\x1a\n")
+        or (header[:4] == b"RIFF" and header[8:12] == b"WEBP")
+    )
+
 
+def _base64_length(raw_size: int) -> int:
+    return (raw_size + 2) // 3 * 4
+
+
+def _b64encode_file(path: str) -> str:
+    encoded = bytearray()
+    with open(path, "rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            return ""
+        # Encode straight from the page cache instead of read() copies.
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                for start in range(0, len(view), BASE64_CHUNK_SIZE):
+                    encoded += _b64.b64encode(view[start : start + BASE64_CHUNK_SIZE])
+    return encoded.decode("ascii")
+
+
+def _fit_jpeg_quality(
+    img: Any, target_max_bytes: int, buffer: io.BytesIO
+) -> tuple[Optional[memoryview], int]:
+    # Returns the chosen JPEG (or None) and the size of the last encode tried.
+    # Sizing uses the Base64 length formula; only the winner is encoded.
+    # A winner still in ``buffer`` is returned as a view rather than copied.
+    def encode(index: int) -> int:
+        buffer.seek(0)
+        buffer.truncate()
+        img.save(buffer, format="JPEG", quality=JPEG_QUALITY_STEPS[index])
+        return buffer.tell()
+
+    size = encode(0)
+    if _base64_length(size) < target_max_bytes:
+        return buffer.getbuffer(), size
+
+    # JPEG size is roughly linear in quality over this range, so the first
+    # overshoot predicts the step that should fit.
+    ratio = target_max_bytes * 3 / 4 / size
+    predicted_quality = JPEG_QUALITY_STEPS[0] * ratio**0.9
+    guess = next(
+        (
+            index
+            for index, quality in enumerate(JPEG_QUALITY_STEPS)
+            if quality <= predicted_quality
+        ),
+        len(JPEG_QUALITY_STEPS) - 1,
+    )
+    size = encode(guess)
+    if _base64_length(size) < target_max_bytes:
+        return buffer.getbuffer(), size
+
+    # Prediction overshot: bisect the lower steps for the highest that fits.
+    best: Optional[memoryview] = None
+    low, high = guess + 1, len(JPEG_QUALITY_STEPS)
+    while low < high:
+        mid = (low + high) // 2
+        size = encode(mid)
+        if _base64_length(size) < target_max_bytes:
+            # Later probes overwrite the buffer, so keep a copy.
+            best = memoryview(buffer.getvalue())
+            high = mid
+        else:
+            low = mid + 1
+    return best, size
 
-def _encode_image_to_base64(path: str, target_max_bytes: int = MAX_IMAGE_BASE64_SIZE) -> str:
+
+def _encode_image_to_base64(
+    path: str,
+    target_max_bytes: int = MAX_IMAGE_BASE64_SIZE,
+    max_edge_px: int = DEFAULT_MAX_EDGE_PX,
+) -> str:
     if not path:
         raise ValueError("Image path is empty.")
     if not os.path.exists(path):
         raise FileNotFoundError(path)
+    if (
+        _base64_length(os.path.getsize(path)) < target_max_bytes
+        and _is_passthrough_format(path)
+    ):
+        # Already in an accepted format and small enough: send the file as-is.
+        return _b64encode_file(path)
+
     try:
         ensure_package("PIL", "Pillow")
         from PIL import Image  # type: ignore[import-not-found]
@@ -153,6 +377,18 @@ def _encode_image_to_base64(path: str, target_max_bytes: int = MAX_IMAGE_BASE64_
 
     try:
         with Image.open(path) as handle:
+            longest = max(handle.size)
+            if handle.format == "JPEG" and 0 < max_edge_px < longest:
+                # Let libjpeg scale during IDCT (1/2, 1/4, 1/8) toward the
+                # target; thumbnail() below trims the rest.
+                ratio = max_edge_px / longest
+                handle.draft(
+                    "RGB",
+                    (
+                        math.ceil(handle.size[0] * ratio),
+                        math.ceil(handle.size[1] * ratio),
+                    ),
+                )
             try:
                 img = handle.convert("RGB")
             except Exception as exc:  # pragma: no cover - depends on PIL backend
@@ -160,19 +396,129 @@ def _encode_image_to_base64(path: str, target_max_bytes: int = MAX_IMAGE_BASE64_
     except Exception as exc:  # pragma: no cover - depends on user file
         raise ValueError(f"Failed to open image: {exc}") from exc
 
-    for quality in JPEG_QUALITY_STEPS:
-        buffer = io.BytesIO()
-        img.save(buffer, format="JPEG", quality=quality, optimize=True)
-        data = buffer.getvalue()
-        encoded = base64.b64encode(data)
-        if len(encoded) < target_max_bytes:
-            return encoded.decode("ascii")
+    if max_edge_px > 0 and max(img.size) > max_edge_px:
+        img.thumbnail((max_edge_px, max_edge_px), Image.Resampling.LANCZOS)
+
+    buffer = io.BytesIO()
+    best, smallest_size = _fit_jpeg_quality(img, target_max_bytes, buffer)
+    while best is None and max(img.size) > MIN_DOWNSCALE_EDGE_PX:
+        # Even the lowest quality overshoots: shrink by the area ratio, with
+        # margin. BOX is much cheaper than LANCZOS and fine for a size fallback.
+        scale = math.sqrt(target_max_bytes * 3 / 4 / smallest_size) * 0.95
+        width, height = img.size
+        # Never step below the floor; the last try is at MIN_DOWNSCALE_EDGE_PX.
+        scale = max(scale, MIN_DOWNSCALE_EDGE_PX / max(width, height))
+        img.thumbnail(
+            (max(1, round(width * scale)), max(1, round(height * scale))),
+            Image.Resampling.BOX,
+        )
+        best, smallest_size = _fit_jpeg_quality(img, target_max_bytes, buffer)
+
+    if best is None:
+        raise ValueError("Encoded image exceeds size limit.")
+    return _b64.b64encode(best).decode("ascii")
+
+
+@functools.lru_cache(maxsize=ENCODE_CACHE_SIZE)
+def _encode_image_to_base64_cached(
+    path: str,
+    mtime_ns: int,
+    size: int,
+    target_max_bytes: int = MAX_IMAGE_BASE64_SIZE,
+    max_edge_px: int = DEFAULT_MAX_EDGE_PX,
+) -> str:
+    # mtime_ns and size only key the cache so an edited file is re-encoded.
+    return _encode_image_to_base64(path, target_max_bytes, max_edge_px)
+
+
+def _prepare_image(path: str, mtime_ns: int, size: int, max_edge_px: int) -> str:
+    image_b64 = _encode_image_to_base64_cached(
+        path, mtime_ns, size, max_edge_px=max_edge_px
+    )
+    if not image_b64:
+        raise ValueError("Image path is empty.")
+    return image_b64
+
+
+def _image_error_message(exc: Exception) -> str:
+    if isinstance(exc, ImportError):
+        return _(
+            "Failed to load Pillow. Use 'Install Dependencies' or check your network access."
+        )
+    if isinstance(exc, FileNotFoundError):
+        return _(_MSG_INVALID_IMAGE)
+    if isinstance(exc, ValueError):
+        text = str(exc)
+        if "Image path is empty." in text:
+            return _(_MSG_INVALID_IMAGE)
+        if "Encoded image exceeds size limit." in text:
+            return _("Image is too large. Ensure the encoded size is under 8MB.")
+    return _("Failed to prepare image: {error}").format(error=exc)
+
+
+def _submit_job(client: Any, params: Dict[str, Any]) -> Dict[str, Any]:
+    response_raw = client.call("SubmitHunyuanTo3DJob", params)
+    response = _json_loads(response_raw).get("Response", {})
+    if not response.get("JobId"):
+        raise ValueError("JobId missing in response.")
+    return response
+
+
+def _query_job(client: Any, job_id: str) -> Dict[str, Any]:
+    raw = client.call("QueryHunyuanTo3DJob", {"JobId": job_id})
+    payload = _json_loads(raw).get("Response", {})
+    if logger.isEnabledFor(logging.DEBUG):
+        try:
+            logger.debug(
+                "Query response for job %s: %s",
+                job_id,
+                json.dumps(payload, ensure_ascii=False, default=str),
+            )
+        except TypeError:
+            logger.debug("Query response for job %s (non-serializable)", job_id)
+    return payload
+
+
+def _result_url(payload: Dict[str, Any]) -> Optional[str]:
+    files = payload.get("ResultFile3Ds")
+    if not files:
+        return None
+    entry = files[0]
+    return entry.get("Url") or entry.get("URL")
 
-    raise ValueError("Encoded image exceeds size limit.")
+
+def _job_status(payload: Dict[str, Any]) -> str:
+    return (payload.get("Status") or payload.get("JobStatus") or "").upper()
+
+
+_NEWLINE_RE = re.compile(r"\r\n?")
 
 
 def _normalize_newlines(text: str) -> str:
-    return text.replace("\r\n", "\n").replace("\r", "\n")
+    if "\r" not in text:
+        return text
+    return _NEWLINE_RE.sub("\n", text)
+
+
+# Prompt files keyed by (path, mtime_ns, size), most recent last.
+_PROMPT_FILE_CACHE: OrderedDict[tuple[str, int, int], str] = OrderedDict()
+
+
+def _read_prompt_file(path: str) -> str:
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    cached = _PROMPT_FILE_CACHE.get(key)
+    if cached is not None:
+        _PROMPT_FILE_CACHE.move_to_end(key)
+        return cached
+    with open(path, "rb") as handle:
+        raw = handle.read()
+    decoded = raw.decode("utf-8", errors="replace")
+    prompt_text = _normalize_newlines(decoded).strip()
+    _PROMPT_FILE_CACHE[key] = prompt_text
+    while len(_PROMPT_FILE_CACHE) > PROMPT_CACHE_SIZE:
+        _PROMPT_FILE_CACHE.popitem(last=False)
+    return prompt_text
 
 
 def _read_prompt_from_source(settings: bpy.types.PropertyGroup) -> str:
@@ -187,12 +533,7 @@ def _read_prompt_from_source(settings: bpy.types.PropertyGroup) -> str:
         if text_block is None:
             logger.warning("Text block '%s' not found for prompt source.", text_name)
             raise ValueError("No text block selected.")
-        raw_text = (
-            text_block.as_string()
-            if hasattr(text_block, "as_string")
-            else "\n".join(line.body for line in text_block.lines)
-        )
-        normalized = _normalize_newlines(raw_text)
+        normalized = _normalize_newlines(text_block.as_string())
         prompt_text = normalized.strip()
     elif source == "EXTERNAL_FILE":
         file_setting = getattr(settings, "prompt_file_path", "") or ""
@@ -201,14 +542,10 @@ def _read_prompt_from_source(settings: bpy.types.PropertyGroup) -> str:
             logger.warning("Prompt file path empty.")
             raise ValueError("File path is empty.")
         try:
-            with open(resolved_path, "rb") as handle:
-                raw = handle.read()
+            prompt_text = _read_prompt_file(resolved_path)
         except OSError as exc:
             logger.error("Failed to read prompt file '%s': %s", resolved_path, exc)
             raise ValueError("Failed to read prompt from file.") from exc
-        decoded = raw.decode("utf-8", errors="replace")
-        normalized = _normalize_newlines(decoded)
-        prompt_text = normalized.strip()
     else:
         inline_prompt = getattr(settings, "prompt", "") or ""
         normalized = _normalize_newlines(inline_prompt)
@@ -224,8 +561,8 @@ def _read_prompt_from_source(settings: bpy.types.PropertyGroup) -> str:
 
 class MH3D_OT_OpenAPILink(Operator):
     bl_idname = "mh3d.open_api_link"
-    bl_label = _("Open API Key Page")
-    bl_description = _("Open the Tencent Cloud API key management page in a browser.")
+    bl_label = "Open API Key Page"
+    bl_description = "Open the Tencent Cloud API key management page in a browser."
 
     def execute(self, context: bpy.types.Context) -> set[str]:
         import webbrowser
@@ -245,15 +582,16 @@ class MH3D_OT_OpenAPILink(Operator):
 
 class MH3D_OT_Generate(Operator):
     bl_idname = "mh3d.generate"
-    bl_label = _("Generate 3D")
-    bl_description = _(
-        "Submit a prompt to the Hunyuan3D API, then download and import the result when ready."
+    bl_label = "Generate 3D"
+    bl_description = (
+        "Submit a prompt to the Hunyuan3D API, "
+        "then download and import the result when ready."
     )
     bl_options = {'REGISTER'}
 
-    _active_job: Optional[str] = None
-    _wait_cursor_count: int = 0
-    _wait_cursor_windows: list[tuple[Window, str]] = []
+    # stop_tracking() of the job currently being prepared or tracked, if any.
+    _stop_active: Optional[Callable[[], None]] = None
+    _progress_manager: Optional[WindowManager] = None
 
     def _resolve_credentials(self, settings: bpy.types.PropertyGroup) -> tuple[str, str]:
         secret_id = os.environ.get("TENCENTCLOUD_SECRET_ID") or settings.secret_id.strip()
@@ -262,35 +600,19 @@ class MH3D_OT_Generate(Operator):
 
     @staticmethod
     def _friendly_hint(exc: Exception) -> str:
+        for attr in ("code", "Code"):
+            code = getattr(exc, attr, "")
+            hint = _HINT_TABLE.get(str(code)) if code else None
+            if hint:
+                return _(hint)
         text_parts = []
         for attr in ("code", "Code", "message", "Message"):
             value = getattr(exc, attr, "")
             if value:
                 text_parts.append(str(value))
         text_parts.append(str(exc))
-        merged = " ".join(text_parts)
-        hints = (
-            (
-                "RequestLimitExceeded.JobNumExceed",
-                _("Another job is running. Wait until it finishes."),
-            ),
-            (
-                "UnsupportedRegion",
-                _(
-                    "This API is unavailable in the selected region. Try ap-guangzhou / ap-shanghai / ap-singapore."
-                ),
-            ),
-            (
-                "AuthFailure.SecretIdNotFound",
-                _(
-                    "Verify that your SecretId/SecretKey are correct and not disabled or deleted."
-                ),
-            ),
-        )
-        for key, hint in hints:
-            if key and key in merged:
-                return hint
-        return ""
+        match = _HINT_RE.search(" ".join(text_parts))
+        return _(_HINT_TABLE[match.group(0)]) if match else ""
 
     def _format_sdk_error(self, prefix: str, exc: Exception) -> str:
         hint = self._friendly_hint(exc)
@@ -298,55 +620,38 @@ class MH3D_OT_Generate(Operator):
             return f"{prefix} {hint}"
         return prefix
 
-    def _set_wait_cursor(self, context: bpy.types.Context) -> None:
-        self._cursor_engaged = False
+    def _begin_progress(self, context: bpy.types.Context) -> None:
+        self._progress_manager = None
         manager = getattr(context, "window_manager", None)
         if manager is None:
             return
-        windows: list[tuple[Window, str]] = []
-        for window in getattr(manager, "windows", []):
-            try:
-                window.cursor_modal_set('WAIT')
-                windows.append((window, "modal"))
-            except Exception:
-                try:
-                    window.cursor_set('WAIT')
-                    windows.append((window, "set"))
-                except Exception:
-                    continue
-        if not windows:
+        try:
+            manager.progress_begin(0, 100)
+        except Exception:
             return
-        cls = type(self)
-        cls._wait_cursor_windows = windows
-        cls._wait_cursor_count += 1
-        self._cursor_engaged = True
+        self._progress_manager = manager
 
-    def _restore_cursor(self) -> None:
-        if not getattr(self, "_cursor_engaged", False):
+    def _update_progress(self, phase: str) -> None:
+        manager = getattr(self, "_progress_manager", None)
+        if manager is None:
             return
-        cls = type(self)
-        if cls._wait_cursor_count > 0:
-            cls._wait_cursor_count -= 1
-        else:
-            cls._wait_cursor_count = 0
-        self._cursor_engaged = False
-        if cls._wait_cursor_count > 0:
+        try:
+            manager.progress_update(_PROGRESS_BY_PHASE[phase])
+        except Exception:
+            pass
+
+    def _end_progress(self) -> None:
+        manager = getattr(self, "_progress_manager", None)
+        if manager is None:
             return
-        windows = cls._wait_cursor_windows
-        cls._wait_cursor_windows = []
-        for window, mode in windows:
-            try:
-                if mode == "modal":
-                    window.cursor_modal_restore()
-            except Exception:
-                pass
-            try:
-                window.cursor_set('DEFAULT')
-            except Exception:
-                pass
+        self._progress_manager = None
+        try:
+            manager.progress_end()
+        except Exception:
+            pass
 
     def execute(self, context: bpy.types.Context) -> set[str]:
-        self._cursor_engaged = False
+        self._progress_manager = None
         scene = context.scene
         if not scene:
             self.report({'ERROR'}, _("No active scene found."))
@@ -356,6 +661,16 @@ class MH3D_OT_Generate(Operator):
             self.report({'ERROR'}, _("Settings are not available on the scene."))
             return {'CANCELLED'}
 
+        # Cheap checks first: no input reads or SDK import without credentials.
+        secret_id, secret_key = self._resolve_credentials(settings)
+        if not secret_id or not secret_key:
+            message = _(
+                "API keys missing: set environment variables or fill SecretId/SecretKey."
+            )
+            self.report({'ERROR'}, message)
+            logger.error(message)
+            return {'CANCELLED'}
+
         input_mode = (getattr(settings, "input_mode", "IMAGE") or "IMAGE").upper()
         if input_mode not in {"PROMPT", "IMAGE"}:
             input_mode = "IMAGE"
@@ -369,68 +684,41 @@ class MH3D_OT_Generate(Operator):
                 "Image path provided while using PROMPT mode; ignoring image_path.",
             )
 
-        image_b64: Optional[str] = None
+        image_source: Optional[tuple[str, int, int, int]] = None
         if input_mode == "PROMPT":
             try:
                 prompt_text = _read_prompt_from_source(settings)
             except ValueError as exc:
                 key = str(exc)
-                translations = {
-                    "No text block selected.": _("No text block selected."),
-                    "File path is empty.": _("File path is empty."),
-                    "Failed to read prompt from file.": _(
-                        "Failed to read prompt from file."
-                    ),
-                    "Prompt is empty.": _("Prompt is empty."),
-                }
-                message = translations.get(key, str(exc))
+                message = _(key) if key in _PROMPT_ERROR_MSGIDS else key
                 self.report({'ERROR'}, message)
                 logger.error(message)
                 return {'CANCELLED'}
         else:
             if not image_path_setting:
-                message = _("Image mode requires a valid image file.")
+                message = _(_MSG_INVALID_IMAGE)
                 self.report({'ERROR'}, message)
                 logger.error(message)
                 return {'CANCELLED'}
             resolved_image_path = bpy.path.abspath(image_path_setting)
             if not resolved_image_path:
-                message = _("Image mode requires a valid image file.")
+                message = _(_MSG_INVALID_IMAGE)
                 self.report({'ERROR'}, message)
                 logger.error(message)
                 return {'CANCELLED'}
             try:
-                image_b64 = _encode_image_to_base64(resolved_image_path)
-            except ImportError as exc:
-                message = _(
-                    "Failed to load Pillow. Use 'Install Dependencies' or check your network access."
-                )
-                self.report({'ERROR'}, message)
-                logger.error("%s Error: %s", message, exc)
-                return {'CANCELLED'}
-            except FileNotFoundError:
-                message = _("Image mode requires a valid image file.")
-                self.report({'ERROR'}, message)
-                logger.error(message)
-                return {'CANCELLED'}
-            except ValueError as exc:
-                limit_key = "Encoded image exceeds size limit."
-                empty_key = "Image path is empty."
-                text = str(exc)
-                if empty_key in text:
-                    message = _("Image mode requires a valid image file.")
-                elif limit_key in text:
-                    message = _("Image is too large. Ensure the encoded size is under 8MB.")
-                else:
-                    message = _("Failed to prepare image: {error}").format(error=exc)
-                self.report({'ERROR'}, message)
-                logger.error(message)
-                return {'CANCELLED'}
-            except Exception as exc:  # pragma: no cover - defensive
-                message = _("Failed to prepare image: {error}").format(error=exc)
+                stat = os.stat(resolved_image_path)
+            except OSError:
+                message = _(_MSG_INVALID_IMAGE)
                 self.report({'ERROR'}, message)
                 logger.error(message)
                 return {'CANCELLED'}
+            image_source = (
+                resolved_image_path,
+                stat.st_mtime_ns,
+                stat.st_size,
+                getattr(settings, "max_edge_px", DEFAULT_MAX_EDGE_PX),
+            )
 
         prompt_param_name = "Prompt"
         try:
@@ -450,33 +738,26 @@ class MH3D_OT_Generate(Operator):
             logger.error(error_text)
             return {'CANCELLED'}
 
-        secret_id, secret_key = self._resolve_credentials(settings)
-        if not secret_id or not secret_key:
-            message = _(
-                "API keys missing: set environment variables or fill SecretId/SecretKey."
-            )
-            self.report({'ERROR'}, message)
-            logger.error(message)
-            return {'CANCELLED'}
+        previous_stop = MH3D_OT_Generate._stop_active
+        if previous_stop is not None:
+            # The new job replaces the one being prepared or tracked.
+            logger.info("Stopping the previous job tracker to start a new job.")
+            previous_stop()
 
         settings.last_error = ""
-        settings.last_status = "SUBMITTING"
+        # Image jobs show SUBMITTING once the worker has finished encoding.
+        settings.last_status = "SUBMITTING" if image_source is None else "PROCESSING"
         settings.job_id = ""
 
-        region = settings.region or DEFAULT_REGION
-        client = _create_client(bundle, secret_id, secret_key, region)
+        region = (settings.region or "").strip() or DEFAULT_REGION
+        client = _get_client(secret_id, secret_key, region)
         params: Dict[str, Any] = {
             "ResultFormat": settings.result_format,
         }
         if input_mode == "PROMPT":
             params[prompt_param_name] = prompt_text
-        else:
-            if not image_b64:
-                message = _("Image mode requires a valid image file.")
-                self.report({'ERROR'}, message)
-                logger.error(message)
-                return {'CANCELLED'}
-            params["ImageBase64"] = image_b64
+        result_format = settings.result_format
+        suffix = _suffix_for_format(result_format)
         reenable_pbr_after_success = not settings.enable_pbr
         if settings.enable_pbr:
             params["EnablePBR"] = True
@@ -488,129 +769,190 @@ class MH3D_OT_Generate(Operator):
             bool(settings.enable_pbr),
         )
 
-        self._set_wait_cursor(context)
-        try:
-            response_raw = client.call("SubmitHunyuanTo3DJob", params)
-            response = json.loads(response_raw).get("Response", {})
-            job_id = response.get("JobId")
-            if not job_id:
-                raise ValueError("JobId missing in response.")
-        except bundle.exception_cls as exc:  # type: ignore[attr-defined]
-            base = _("API error during submission: {error}").format(error=str(exc))
-            message = self._format_sdk_error(base, exc)
-            settings.last_status = "ERROR"
-            settings.last_error = message
-            self._restore_cursor()
-            self.report({'ERROR'}, message)
-            logger.error("Submission failed: %s", exc)
-            return {'CANCELLED'}
-        except Exception as exc:
-            message = _("Unexpected error during submission: {error}").format(error=exc)
-            settings.last_status = "ERROR"
-            settings.last_error = message
-            self._restore_cursor()
-            self.report({'ERROR'}, message)
-            logger.error("Submission failed: %s", exc)
-            return {'CANCELLED'}
+        # The worker thread must not touch bpy; it only hands results back.
+        outcome: queue.SimpleQueue[tuple[str, Any]] = queue.SimpleQueue()
+        stop = threading.Event()
+        # Orders the download hand-off against stop_tracking() draining the queue.
+        handoff = threading.Lock()
 
-        settings.job_id = job_id
-        settings.last_status = response.get("Status", "SUBMITTED")
-        self._active_job = job_id
-
-        info_message = _("Job submitted. Tracking in the status panel.")
+        def download_result(url: str) -> None:
+            try:
+                filepath = _download_file(url, suffix)
+            except Exception as exc:
+                outcome.put(("download", exc))
+                return
+            with handoff:
+                if not stop.is_set():
+                    outcome.put(("downloaded", filepath))
+                    return
+            # Nobody will import it any more.
+            _remove_temp_file(filepath)
+
+        def job_worker() -> None:
+            if image_source is not None:
+                try:
+                    params["ImageBase64"] = _prepare_image(*image_source)
+                except Exception as exc:
+                    outcome.put(("image", exc))
+                    return
+                outcome.put(("encoded", None))
+            try:
+                response = _submit_job(client, params)
+            except Exception as exc:
+                outcome.put(("submit", exc))
+                return
+            outcome.put(("submitted", response))
+
+            worker_job_id = response["JobId"]
+            deadline = time.monotonic() + POLL_TIMEOUT
+            last_status = None
+            delay = POLL_INTERVAL
+            interval = POLL_INTERVAL
+            while not stop.wait(interval):
+                try:
+                    payload = _query_job(client, worker_job_id)
+                except Exception as exc:
+                    outcome.put(("query", exc))
+                    return
+                outcome.put(("status", payload))
+                status_upper = _job_status(payload)
+                if status_upper in _SUCCESS_STATUSES:
+                    url = _result_url(payload)
+                    if url:
+                        download_result(url)
+                    return
+                if status_upper in _FAILURE_STATUSES:
+                    return
+                if status_upper != last_status:
+                    last_status = status_upper
+                    delay = POLL_INTERVAL
+                else:
+                    delay = min(delay * POLL_BACKOFF, POLL_MAX_INTERVAL)
+                interval = delay * random.uniform(1 - POLL_JITTER, 1 + POLL_JITTER)
+                if status_upper in _QUEUED_STATUSES:
+                    interval = max(interval, QUEUED_POLL_INTERVAL)
+                if time.monotonic() >= deadline:
+                    outcome.put(("timeout", None))
+                    return
+
+        self._begin_progress(context)
+        threading.Thread(target=job_worker, name="mh3d-job", daemon=True).start()
+
+        info_message = _("Preparing job. Tracking in the status panel.")
         self.report({'INFO'}, info_message)
-        logger.info("Submitted job %s", job_id)
 
-        def poll_job() -> Optional[float]:
+        job_id = ""
+
+        def stop_tracking() -> None:
+            with handoff:
+                stop.set()
+            # A result downloaded before the stop would otherwise be left behind.
+            while True:
+                try:
+                    kind, value = outcome.get_nowait()
+                except queue.Empty:
+                    break
+                if kind == "downloaded":
+                    _remove_temp_file(value)
+            self._end_progress()
+            if MH3D_OT_Generate._stop_active is stop_tracking:
+                MH3D_OT_Generate._stop_active = None
+
+        def drain_job() -> Optional[float]:
+            nonlocal job_id
+            if stop.is_set():
+                # Stopped from outside, e.g. replaced by a newer Generate.
+                return None
+            try:
+                kind, value = outcome.get_nowait()
+            except queue.Empty:
+                return RESULT_CHECK_INTERVAL
             scene_inner = bpy.context.scene
-            if not scene_inner or not hasattr(scene_inner, "mh3d_settings"):
-                logger.warning("Scene missing while polling job %s; stopping timer.", job_id)
-                self._restore_cursor()
-                self._active_job = None
+            settings_inner = getattr(scene_inner, "mh3d_settings", None)
+            if settings_inner is None:
+                logger.warning(
+                    "Scene missing while tracking job %s; stopping.", job_id or "-"
+                )
+                stop_tracking()
                 return None
-            settings_inner = scene_inner.mh3d_settings
-            if settings_inner.job_id != job_id:
+            if job_id and settings_inner.job_id != job_id:
                 logger.info(
                     "Job id changed (now %s). Stop polling previous job %s.",
                     settings_inner.job_id,
                     job_id,
                 )
-                self._restore_cursor()
-                self._active_job = None
+                stop_tracking()
                 return None
 
-            try:
-                client_inner = _create_client(bundle, secret_id, secret_key, region)
-                raw = client_inner.call("QueryHunyuanTo3DJob", {"JobId": job_id})
-                payload = json.loads(raw).get("Response", {})
-                try:
-                    logger.debug(
-                        "Query response for job %s: %s",
-                        job_id,
-                        json.dumps(payload, ensure_ascii=False, indent=2, default=str),
+            if kind in {"image", "submit"}:
+                if kind == "image":
+                    message_inner = _image_error_message(value)
+                elif isinstance(value, bundle.exception_cls):  # type: ignore[arg-type]
+                    base_inner = _("API error during submission: {error}").format(
+                        error=str(value)
+                    )
+                    message_inner = self._format_sdk_error(base_inner, value)
+                else:
+                    message_inner = _("Unexpected error during submission: {error}").format(
+                        error=value
                     )
-                except TypeError:
-                    logger.debug("Query response for job %s (non-serializable)", job_id)
-            except bundle.exception_cls as exc:  # type: ignore[attr-defined]
-                base_inner = _("API error while querying job: {error}").format(
-                    error=str(exc)
-                )
-                message_inner = self._format_sdk_error(base_inner, exc)
                 settings_inner.last_status = "ERROR"
                 settings_inner.last_error = message_inner
-                logger.error("Query failed for job %s: %s", job_id, exc)
-                self._restore_cursor()
-                self._active_job = None
+                logger.error("Submission failed: %s", value)
+                stop_tracking()
                 return None
-            except Exception as exc:  # pragma: no cover - depends on network state
-                message_inner = _("Query error: {error}").format(error=exc)
+
+            if kind == "encoded":
+                settings_inner.last_status = "SUBMITTING"
+                self._update_progress("ENCODED")
+                return RESULT_CHECK_INTERVAL
+
+            if kind == "submitted":
+                job_id = value["JobId"]
+                settings_inner.job_id = job_id
+                settings_inner.last_status = value.get("Status", "SUBMITTED")
+                logger.info("Submitted job %s", job_id)
+                self._update_progress("SUBMITTED")
+                return RESULT_CHECK_INTERVAL
+
+            if kind == "query":
+                if isinstance(value, bundle.exception_cls):  # type: ignore[arg-type]
+                    base_inner = _("API error while querying job: {error}").format(
+                        error=str(value)
+                    )
+                    message_inner = self._format_sdk_error(base_inner, value)
+                else:
+                    message_inner = _("Query error: {error}").format(error=value)
                 settings_inner.last_status = "ERROR"
                 settings_inner.last_error = message_inner
-                logger.error("Query failed for job %s: %s", job_id, exc)
-                self._restore_cursor()
-                self._active_job = None
+                logger.error("Query failed for job %s: %s", job_id, value)
+                stop_tracking()
                 return None
 
-            status = payload.get("Status") or payload.get("JobStatus") or ""
-            status_upper = (status or "").upper()
-            settings_inner.last_status = status_upper or "UNKNOWN"
+            if kind == "download":
+                message_inner = _("Download error: {error}").format(error=value)
+                settings_inner.last_status = "ERROR"
+                settings_inner.last_error = message_inner
+                logger.error("Download failed for job %s: %s", job_id, value)
+                stop_tracking()
+                return None
 
-            success_statuses = {"DONE", "SUCCEED", "SUCCEEDED", "SUCCESS"}
-            failure_statuses = {"FAIL", "FAILED"}
-
-            if status_upper not in success_statuses | failure_statuses:
-                return POLL_INTERVAL
-            if status_upper in success_statuses:
-                files = payload.get("ResultFile3Ds") or []
-                url = None
-                if files:
-                    url = files[0].get("Url") or files[0].get("URL")
-                if not url:
-                    settings_inner.last_error = _(
-                        "Job completed but no download URL was returned."
-                    )
-                    settings_inner.last_status = "ERROR"
-                    try:
-                        payload_dump = json.dumps(
-                            payload, ensure_ascii=False, indent=2, default=str
-                        )
-                    except TypeError:
-                        payload_dump = str(payload)
-                    logger.error(
-                        "Job %s completed but returned no URL. Payload: %s",
-                        job_id,
-                        payload_dump,
-                    )
-                    self._restore_cursor()
-                    self._active_job = None
-                    return None
-                suffix = _suffix_for_format(settings_inner.result_format)
-                filepath = ""
+            if kind == "timeout":
+                settings_inner.last_status = "FAIL"
+                settings_inner.last_error = _(
+                    "Job did not finish within {minutes} minutes."
+                ).format(minutes=int(POLL_TIMEOUT // 60))
+                logger.error("Job %s timed out after %d seconds.", job_id, POLL_TIMEOUT)
+                stop_tracking()
+                return None
+
+            if kind == "downloaded":
+                filepath = value
+                logger.info("Downloaded job %s result to %s", job_id, filepath)
                 try:
-                    filepath = _download_file(url, suffix)
-                    logger.info("Downloaded job %s result to %s", job_id, filepath)
                     settings_inner.last_status = "IMPORTING"
-                    _import_model(filepath, settings_inner.result_format)
+                    self._update_progress("IMPORTING")
+                    _import_model(filepath, result_format)
                     settings_inner.last_status = "IMPORTED"
                     settings_inner.last_error = ""
                     logger.info("Imported job %s result successfully.", job_id)
@@ -621,38 +963,55 @@ class MH3D_OT_Generate(Operator):
                         logger.info(
                             "Re-enabled PBR after successful import for job %s.", job_id
                         )
-                except urllib.error.URLError as exc:
-                    message_inner = _("Download error: {error}").format(error=exc)
-                    settings_inner.last_status = "ERROR"
-                    settings_inner.last_error = message_inner
-                    logger.error("Download failed for job %s: %s", job_id, exc)
                 except Exception as exc:
                     message_inner = _("Import failed: {error}").format(error=exc)
                     settings_inner.last_status = "ERROR"
                     settings_inner.last_error = message_inner
                     logger.error("Import failed for job %s: %s", job_id, exc)
                 finally:
-                    if filepath and os.path.exists(filepath):
-                        try:
-                            os.remove(filepath)
-                        except Exception:  # pragma: no cover - best effort cleanup
-                            logger.warning("Failed to remove temporary file %s", filepath)
-                self._restore_cursor()
-                self._active_job = None
+                    _remove_temp_file(filepath)
+                stop_tracking()
+                return None
+
+            payload = value
+            status_upper = _job_status(payload)
+            settings_inner.last_status = status_upper or "UNKNOWN"
+            self._update_progress("QUEUED" if status_upper in _QUEUED_STATUSES else "RUNNING")
+
+            if status_upper in _SUCCESS_STATUSES:
+                if _result_url(payload):
+                    # The job thread downloads the result next.
+                    return RESULT_CHECK_INTERVAL
+                settings_inner.last_error = _(
+                    "Job completed but no download URL was returned."
+                )
+                settings_inner.last_status = "ERROR"
+                try:
+                    payload_dump = json.dumps(
+                        payload, ensure_ascii=False, indent=2, default=str
+                    )
+                except TypeError:
+                    payload_dump = str(payload)
+                logger.error(
+                    "Job %s completed but returned no URL. Payload: %s",
+                    job_id,
+                    payload_dump,
+                )
+                stop_tracking()
                 return None
-            if status_upper in failure_statuses:
+            if status_upper in _FAILURE_STATUSES:
                 error_message = payload.get("ErrorMessage") or _(
                     "Generation failed. Review your prompt and output format."
                 )
                 settings_inner.last_error = error_message
                 logger.error("Job %s failed: %s", job_id, error_message)
-                self._restore_cursor()
-                self._active_job = None
+                stop_tracking()
                 return None
 
-            return POLL_INTERVAL
+            return RESULT_CHECK_INTERVAL
 
-        bpy.app.timers.register(poll_job, first_interval=POLL_INTERVAL)
+        MH3D_OT_Generate._stop_active = stop_tracking
+        bpy.app.timers.register(drain_job, first_interval=RESULT_CHECK_INTERVAL)
         return {'FINISHED'}
 
 
@@ -666,6 +1025,12 @@ def register() -> None:
 
 
 def unregister() -> None:
+    _get_client.cache_clear()
+    if _download_pool.cache_info().currsize:
+        pool = _download_pool()
+        if pool is not None:
+            pool.clear()
+        _download_pool.cache_clear()
     for cls in reversed(_CLASSES):
         try:
             bpy.utils.unregister_class(cls)
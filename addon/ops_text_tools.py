@@ -3,6 +3,8 @@
 
 from __future__ import annotations
 
+import re
+
 import bpy
 from bpy.app.translations import pgettext_iface as _
 from bpy.props import StringProperty
@@ -12,6 +14,9 @@ from . import get_logger
 
 logger = get_logger()
 
+_CRLF_RE = re.compile(r"\r\n?")
+_CRLF_BYTES_RE = re.compile(rb"\r\n?")
+
 
 def _get_settings(context: bpy.types.Context):
     scene = getattr(context, "scene", None)
@@ -31,8 +36,8 @@ def _get_selected_text(settings) -> bpy.types.Text | None:
 
 class MH3D_OT_OpenTextEditor(Operator):
     bl_idname = "mh3d.open_text_editor"
-    bl_label = _("Open Text Editor")
-    bl_description = _("Open a separate Text Editor window for prompt editing.")
+    bl_label = "Open Text Editor"
+    bl_description = "Open a separate Text Editor window for prompt editing."
 
     def execute(self, context: bpy.types.Context) -> set[str]:
         window_manager = getattr(context, "window_manager", None)
@@ -41,7 +46,7 @@ class MH3D_OT_OpenTextEditor(Operator):
             logger.error("Window manager unavailable when opening Text Editor window.")
             return {'CANCELLED'}
 
-        windows_before = {window.as_pointer() for window in window_manager.windows}
+        windows_before = frozenset(window.as_pointer() for window in window_manager.windows)
         try:
             result = bpy.ops.wm.window_new()
         except Exception as exc:
@@ -54,18 +59,19 @@ class MH3D_OT_OpenTextEditor(Operator):
             logger.error("Operator wm.window_new returned %s", result)
             return {'CANCELLED'}
 
-        windows_after = {
-            window.as_pointer(): window for window in window_manager.windows
-        }
-        new_windows = [
-            window for ptr, window in windows_after.items() if ptr not in windows_before
-        ]
-        if not new_windows:
+        new_window = next(
+            (
+                window
+                for window in window_manager.windows
+                if window.as_pointer() not in windows_before
+            ),
+            None,
+        )
+        if new_window is None:
             self.report({'ERROR'}, _("Failed to open Text Editor window."))
             logger.error("No new window detected after wm.window_new call.")
             return {'CANCELLED'}
 
-        new_window = new_windows[-1]
         screen = getattr(new_window, "screen", None)
         if screen is None:
             self.report({'ERROR'}, _("Failed to open Text Editor window."))
@@ -97,8 +103,8 @@ class MH3D_OT_OpenTextEditor(Operator):
 
 class MH3D_OT_NewText(Operator):
     bl_idname = "mh3d.new_text"
-    bl_label = _("New Text")
-    bl_description = _("Create a new Blender Text datablock for prompt editing.")
+    bl_label = "New Text"
+    bl_description = "Create a new Blender Text datablock for prompt editing."
 
     def execute(self, context: bpy.types.Context) -> set[str]:
         settings = _get_settings(context)
@@ -116,8 +122,8 @@ class MH3D_OT_NewText(Operator):
 
 class MH3D_OT_SaveTextToFile(Operator):
     bl_idname = "mh3d.save_text_to_file"
-    bl_label = _("Save Text to File")
-    bl_description = _("Save the selected text datablock to an external file.")
+    bl_label = "Save Text to File"
+    bl_description = "Save the selected text datablock to an external file."
 
     filepath: StringProperty(
         name=_("Prompt File"),
@@ -160,13 +166,10 @@ class MH3D_OT_SaveTextToFile(Operator):
             logger.warning("Save path empty when trying to export text.")
             return {'CANCELLED'}
 
-        content = text.as_string() if hasattr(text, "as_string") else "\n".join(
-            line.body for line in text.lines
-        )
-        normalized = content.replace("\r\n", "\n").replace("\r", "\n")
+        normalized = _CRLF_RE.sub("\n", text.as_string())
         try:
-            with open(path, "w", encoding="utf-8", newline="\n") as handle:
-                handle.write(normalized)
+            with open(path, "wb") as handle:
+                handle.write(normalized.encode("utf-8"))
         except OSError as exc:
             self.report({'ERROR'}, str(exc))
             logger.error("Failed to save text to '%s': %s", path, exc)
@@ -179,8 +182,8 @@ class MH3D_OT_SaveTextToFile(Operator):
 
 class MH3D_OT_LoadFileToText(Operator):
     bl_idname = "mh3d.load_file_to_text"
-    bl_label = _("Load File to Text")
-    bl_description = _("Load an external text file into the selected text datablock.")
+    bl_label = "Load File to Text"
+    bl_description = "Load an external text file into the selected text datablock."
 
     filepath: StringProperty(
         name=_("Prompt File"),
@@ -225,10 +228,9 @@ class MH3D_OT_LoadFileToText(Operator):
             logger.error("Failed to read prompt file '%s': %s", path, exc)
             return {'CANCELLED'}
 
-        decoded = raw.decode("utf-8", errors="replace")
-        normalized = decoded.replace("\r\n", "\n").replace("\r", "\n")
-        text.clear()
-        text.write(normalized)
+        # CR never occurs inside a UTF-8 multi-byte sequence, so normalize bytes.
+        normalized = _CRLF_BYTES_RE.sub(b"\n", raw).decode("utf-8", errors="replace")
+        text.from_string(normalized)
         text.filepath = path
         logger.info("Loaded file '%s' into text datablock '%s'.", path, text.name)
         return {'FINISHED'}
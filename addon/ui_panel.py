@@ -6,7 +6,7 @@ from __future__ import annotations
 import bpy
 from bpy.app.translations import pgettext_iface as _
 
-from . import get_logger
+from . import get_logger, i18n
 
 logger = get_logger()
 
@@ -36,12 +36,12 @@ def _format_status(value: str) -> str:
     key = (value or "").upper()
     label = _STATUS_TRANSLATIONS.get(key)
     if label is not None:
-        return _(label)
+        return i18n.STATUS_LABELS.get(label) or _(label)
     return value or _("-")
 
 
 class MH3D_PT_MainPanel(bpy.types.Panel):
-    bl_label = _("Monkey hunyuan3D")
+    bl_label = "Monkey hunyuan3D"
     bl_idname = "MH3D_PT_main_panel"
     bl_space_type = 'VIEW_3D'
     bl_region_type = 'UI'
@@ -100,6 +100,7 @@ class MH3D_PT_MainPanel(bpy.types.Panel):
                 inline_col.prop(settings, "prompt", text=_("Prompt"))
         else:
             input_box.prop(settings, "image_path", text=_("Image File"))
+            input_box.prop(settings, "max_edge_px", text=_("Max Image Edge"))
             input_box.label(
                 text=_(
                     "Images under 8MB after encoding are supported. Large files are recompressed automatically."
@@ -21,6 +21,8 @@ def _ensure_vendor_path() -> None:
 def ensure_package(mod_name: str, pip_name: Optional[str] = None, version: Optional[str] = None) -> None:
     """Ensure *mod_name* can be imported, installing it into ``vendor/`` if needed."""
     _ensure_vendor_path()
+    if mod_name in sys.modules:
+        return
     try:
         importlib.import_module(mod_name)
         return